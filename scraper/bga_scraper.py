@@ -24,6 +24,7 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -35,12 +36,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-try:
-    import requests
-except ImportError:
-    print("Error: requests library required. Install with: pip install requests")
-    sys.exit(1)
-
 # BGA URLs
 BGA_BASE = "https://boardgamearena.com"
 BGA_EN_BASE = "https://en.boardgamearena.com"
@@ -52,11 +47,21 @@ BGA_TABLE_URL = f"{BGA_EN_BASE}/table/table/tableinfos.html"
 ARK_NOVA_GAME_ID = "arknova"
 
 
+def import_requests():
+    """Import requests on first use so tools that only import this module start fast."""
+    try:
+        import requests
+    except ImportError:
+        print("Error: requests library required. Install with: pip install requests")
+        sys.exit(1)
+    return requests
+
+
 class BGAScraper:
     def __init__(self, email: str = None, password: str = None):
         self.email = email
         self.password = password
-        self.session = requests.Session()
+        self.session = import_requests().Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Accept": "application/json, text/javascript, */*; q=0.01",
@@ -64,6 +69,14 @@ class BGAScraper:
         })
         self.logged_in = False
 
+    def clone(self) -> "BGAScraper":
+        """A copy with its own session (same cookies/headers), for use from another thread."""
+        other = BGAScraper(self.email, self.password)
+        other.session.headers.update(self.session.headers)
+        other.session.cookies.update(self.session.cookies)
+        other.logged_in = self.logged_in
+        return other
+
     def load_cookies(self, cookies_path: Path) -> bool:
         """Load cookies from a JSON file exported from browser."""
         if not cookies_path.exists():
@@ -309,9 +322,44 @@ class BGAScraper:
             "url": f"{BGA_BASE}/table?table={table_id}",
         }
 
-    def scrape_all_games(self, limit: int = 100) -> list:
+    def get_game_histories(self, player_ids: list, limit: int = 100) -> list:
+        """Fetch several players' histories concurrently, keeping each table once.
+
+        Every player's full history is still fetched; tracked players mostly
+        share tables, so the merged list keeps each table once (first seen wins)
+        and the output has no duplicate games. limit applies to the merged list,
+        as in playwright_scraper.py, so it is the most games returned in total.
+        """
+        with ThreadPoolExecutor(max_workers=len(player_ids)) as pool:
+            histories = list(pool.map(
+                lambda pid: self.clone().get_game_history(pid, limit), player_ids
+            ))
+
+        seen = set()
+        tables = []
+        for history in histories:
+            for table in history:
+                table_id = str(table.get("table_id", table.get("id", "")))
+                if table_id not in seen:
+                    seen.add(table_id)
+                    tables.append(table)
+
+        listed = sum(len(h) for h in histories)
+        logger.info(
+            f"{listed} tables listed across {len(player_ids)} players, {len(tables)} unique "
+            f"({listed - len(tables)} duplicate tables dropped)"
+        )
+        if limit and len(tables) > limit:
+            logger.info(f"Limiting to {limit} games")
+            tables = tables[:limit]
+        return tables
+
+    def scrape_all_games(self, limit: int = 100, player_ids: list = None) -> list:
         """Scrape all Ark Nova games and return formatted data."""
-        tables = self.get_game_history(limit=limit)
+        if player_ids and len(player_ids) > 1:
+            tables = self.get_game_histories(player_ids, limit=limit)
+        else:
+            tables = self.get_game_history(player_ids[0] if player_ids else None, limit=limit)
 
         games = []
         for i, table in enumerate(tables):
@@ -361,6 +409,8 @@ def main():
     parser.add_argument("--email", "-e", help="BGA email - deprecated, use --cookies")
     parser.add_argument("--password", "-p", help="BGA password - deprecated, use --cookies")
     parser.add_argument("--limit", "-l", type=int, default=100, help="Max games to fetch")
+    parser.add_argument("--players", nargs="+", metavar="PLAYER_ID",
+                        help="Fetch and combine these players' histories")
     parser.add_argument("--output", "-o", default="../data/games.json", help="Output file path")
 
     args = parser.parse_args()
@@ -392,6 +442,7 @@ def main():
     email = args.email or config.get("email") or os.environ.get("BGA_EMAIL")
     password = args.password or config.get("password") or os.environ.get("BGA_PASSWORD")
     limit = args.limit if args.limit != 100 else config.get("limit", 100)
+    player_ids = args.players or config.get("players")
 
     # Resolve output path
     output_path = (script_dir / args.output).resolve()
@@ -436,7 +487,7 @@ def main():
         logger.error('  {"cookies": "path/to/cookies.json", "limit": 100}')
         sys.exit(1)
 
-    games = scraper.scrape_all_games(limit=limit)
+    games = scraper.scrape_all_games(limit=limit, player_ids=player_ids)
 
     if games:
         save_games(games, output_path)
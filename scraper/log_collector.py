@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Collect Ark Nova game logs with the BGAScraper cookie session.
+
+Finds games in docs/data/detailed_games.json (and scraper/new_games.json) that
+have no log yet, fetches their logs from BGA in parallel and parses them into
+the same shape tampermonkey_gamelog.js produces. Each log is appended to
+scraper/new_logs.partial.jsonl as soon as it arrives, so an interrupted run
+picks up where it left off. When the run finishes the collected logs are moved
+into scraper/new_logs.json, ready for scripts/merge_data.py.
+
+Usage:
+    python log_collector.py --cookies cookies.json
+    python log_collector.py --cookies cookies.json --workers 8
+    python log_collector.py --cookies cookies.json 794739898 795000000
+"""
+
+import argparse
+import html
+import json
+import logging
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+from bga_scraper import BGAScraper, BGA_BASE
+
+logger = logging.getLogger(__name__)
+
+BGA_LOGS_URL = f"{BGA_BASE}/archive/archive/logs.html"
+
+SCRAPER_DIR = Path(__file__).parent
+DOCS_DATA_DIR = SCRAPER_DIR.parent / "docs" / "data"
+
+DETAILED_GAMES_FILE = DOCS_DATA_DIR / "detailed_games.json"
+DETAILED_LOGS_FILE = DOCS_DATA_DIR / "detailed_game_logs.json"
+NEW_GAMES_FILE = SCRAPER_DIR / "new_games.json"
+NEW_LOGS_FILE = SCRAPER_DIR / "new_logs.json"
+SPOOL_FILE = SCRAPER_DIR / "new_logs.partial.jsonl"
+
+TEMPLATE_PATTERN = re.compile(r"\$\{(\w+)\}")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def render_log(template: str, args: dict) -> str:
+    """Fill a BGA log template like '${player_name} plays ${card_name}'."""
+    def replace(match):
+        value = args.get(match.group(1), "")
+        # Sub-strings can themselves be templates
+        if isinstance(value, dict) and "log" in value:
+            return render_log(value["log"], value.get("args", {}))
+        return str(value)
+
+    text = TEMPLATE_PATTERN.sub(replace, template or "")
+    return html.unescape(TAG_PATTERN.sub("", text)).strip()
+
+
+def parse_log_packets(table_id: str, packets: list) -> dict:
+    """Turn the archive endpoint's packets into a tampermonkey_gamelog.js-style log."""
+    moves = {}
+    players = []
+    current_move = None
+
+    for packet in packets:
+        if packet.get("move_id") not in (None, ""):
+            current_move = int(packet["move_id"])
+        if current_move is None:
+            continue  # setup notifications before Move 1
+
+        for notif in packet.get("data", []):
+            args = notif.get("args") or {}
+            name = args.get("player_name")
+            if isinstance(name, str) and name and name not in players:
+                players.append(name)
+
+            action = render_log(notif.get("log", ""), args)
+            if action:
+                moves.setdefault(current_move, []).append(action)
+
+    log_entries = [{"moveNumber": m, "actions": moves[m]} for m in sorted(moves)]
+    return {
+        "tableId": table_id,
+        "url": f"{BGA_BASE}/gamereview?table={table_id}",
+        "collectedAt": datetime.utcnow().isoformat() + "Z",
+        "players": players,
+        "logEntries": log_entries,
+        "moveCount": len(log_entries),
+    }
+
+
+def load_json_list(path: Path, key: str) -> list:
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return json.load(f).get(key, [])
+
+
+def read_spool() -> list:
+    """Logs already collected by a previous (possibly interrupted) run."""
+    if not SPOOL_FILE.exists():
+        return []
+    logs = []
+    with open(SPOOL_FILE) as f:
+        for line in f:
+            try:
+                logs.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # partial last line from an interrupted write
+    return logs
+
+
+def flush_spool() -> int:
+    """Move spooled logs into new_logs.json. Returns how many were added."""
+    spooled = read_spool()
+    if not spooled:
+        if SPOOL_FILE.exists():
+            SPOOL_FILE.unlink()
+        return 0
+
+    logs = load_json_list(NEW_LOGS_FILE, "logs")
+    existing_ids = {log["tableId"] for log in logs}
+    added = [log for log in spooled if log["tableId"] not in existing_ids]
+    logs.extend(added)
+
+    tmp_path = NEW_LOGS_FILE.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"logs": logs}, f, indent=2)
+    tmp_path.replace(NEW_LOGS_FILE)
+    SPOOL_FILE.unlink()
+    return len(added)
+
+
+def missing_table_ids() -> list:
+    """Games we have stats for but no log yet, oldest table first."""
+    game_ids = [g["tableId"] for g in load_json_list(DETAILED_GAMES_FILE, "games")]
+    game_ids += [g["tableId"] for g in load_json_list(NEW_GAMES_FILE, "games")]
+
+    have_logs = {log["tableId"] for log in load_json_list(DETAILED_LOGS_FILE, "logs")}
+    have_logs |= {log["tableId"] for log in load_json_list(NEW_LOGS_FILE, "logs")}
+    have_logs |= {log["tableId"] for log in read_spool()}
+
+    return sorted({t for t in game_ids if t not in have_logs}, key=int)
+
+
+class LogCollector:
+    def __init__(self, scraper: BGAScraper, workers: int = 4):
+        self.scraper = scraper
+        self.workers = workers
+        self._local = threading.local()
+
+    def _session(self):
+        """A per-thread copy of the scraper's logged-in session."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self.scraper.clone().session
+        return session
+
+    def fetch_log(self, table_id: str):
+        """Fetch and parse one table's log, or None if BGA didn't return one."""
+        response = self._session().get(
+            BGA_LOGS_URL,
+            params={"table": table_id, "translated": "true"},
+            timeout=30,
+        )
+        if response.status_code != 200:
+            logger.error(f"Table {table_id}: HTTP {response.status_code}")
+            return None
+        try:
+            data = response.json()
+        except json.JSONDecodeError:
+            logger.error(f"Table {table_id}: response was not JSON")
+            return None
+        if str(data.get("status")) != "1":
+            logger.error(f"Table {table_id}: {data.get('error', 'no log available')}")
+            return None
+
+        packets = data.get("data", {}).get("logs", [])
+        return parse_log_packets(table_id, packets)
+
+    def _spool(self, log: dict):
+        # Only called from the collecting thread, one line per finished log
+        with open(SPOOL_FILE, "a") as f:
+            f.write(json.dumps(log) + "\n")
+
+    def collect(self, table_ids: list) -> int:
+        """Fetch logs concurrently, spooling each one as it completes."""
+        if not table_ids:
+            return 0
+
+        logger.info(f"Collecting {len(table_ids)} logs with {self.workers} workers...")
+        collected = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self.fetch_log, t): t for t in table_ids}
+            try:
+                for future in as_completed(futures):
+                    table_id = futures[future]
+                    try:
+                        log = future.result()
+                    except Exception as e:
+                        logger.error(f"Table {table_id}: {e}")
+                        continue
+                    if log and log["logEntries"]:
+                        self._spool(log)
+                        collected += 1
+                        logger.info(f"[{collected}/{len(table_ids)}] {table_id}: {log['moveCount']} moves")
+                    elif log:
+                        logger.warning(f"Table {table_id}: log was empty")
+            except KeyboardInterrupt:
+                # Don't start queued fetches; finished ones are already spooled
+                for future in futures:
+                    future.cancel()
+                raise
+        return collected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collect Ark Nova game logs from BGA")
+    parser.add_argument("table_ids", nargs="*", help="Tables to collect (default: all missing logs)")
+    parser.add_argument("--cookies", "-k", default="cookies.json", help="Path to cookies JSON file")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Parallel requests (default: 4)")
+    args = parser.parse_args()
+
+    cookies_path = Path(args.cookies)
+    if not cookies_path.is_absolute():
+        cookies_path = SCRAPER_DIR / cookies_path
+
+    # Finish off anything an interrupted run already fetched
+    resumed = flush_spool()
+    if resumed:
+        logger.info(f"Recovered {resumed} logs from an interrupted run")
+
+    table_ids = args.table_ids or missing_table_ids()
+    if not table_ids:
+        logger.info("No missing logs")
+        return
+
+    scraper = BGAScraper()
+    if not scraper.load_cookies(cookies_path) or not scraper.verify_session():
+        logger.error("Cookie session is not valid or expired")
+        sys.exit(1)
+
+    collector = LogCollector(scraper, workers=args.workers)
+    try:
+        collector.collect(table_ids)
+    finally:
+        added = flush_spool()
+        logger.info(f"Added {added} logs to {NEW_LOGS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
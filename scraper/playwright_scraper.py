@@ -10,6 +10,9 @@ Usage:
 
     2. Subsequent runs: python playwright_scraper.py
        (Uses saved session to scrape games)
+
+    3. Several players at once: python playwright_scraper.py --players ID1 ID2 ID3
+       (Histories are read concurrently and shared tables are only scraped once)
 """
 
 import asyncio
@@ -19,20 +22,117 @@ import re
 from pathlib import Path
 from datetime import datetime
 
-try:
-    from playwright.async_api import async_playwright
-except ImportError:
-    print("Playwright not installed. Run:")
-    print("  pip install playwright")
-    print("  playwright install chromium")
-    exit(1)
-
-
 PLAYER_ID = "95147106"
 AUTH_FILE = Path(__file__).parent / "playwright_auth.json"
 OUTPUT_FILE = Path(__file__).parent.parent / "data" / "detailed_games.json"
 
 
+def import_playwright():
+    """Import Playwright on first use; it is slow to load and not needed for --help."""
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        print("Playwright not installed. Run:")
+        print("  pip install playwright")
+        print("  playwright install chromium")
+        exit(1)
+    return async_playwright
+
+
+# True once the page shows a logged-in BGA session
+LOGGED_IN_JS = """() => document.body.innerHTML.includes("'user_status': 'logged'")"""
+
+# Reads the end-of-game stats table on a table page
+STATS_TABLE_JS = """
+    (tableId) => {
+        const rows = [...document.querySelectorAll('table.statstable tr')];
+        if (rows.length === 0) return null;
+
+        const data = rows.map(r =>
+            [...r.querySelectorAll('td,th')].map(c => c.innerText.trim())
+        );
+
+        const players = data[0].slice(1);
+        const stats = {};
+
+        for (let i = 1; i < data.length; i++) {
+            const statName = data[i][0];
+            if (!statName || statName === 'All stats') continue;
+            stats[statName] = {};
+            players.forEach((p, j) => {
+                stats[statName][p] = data[i][j + 1] || '';
+            });
+        }
+
+        return {
+            tableId: tableId,
+            url: window.location.href,
+            players: players,
+            stats: stats
+        };
+    }
+"""
+
+
+async def get_table_ids(page, player_id: str = PLAYER_ID) -> list:
+    """Table IDs listed on a player's Ark Nova gamestats page."""
+    print(f"Loading game stats page for player {player_id}...")
+    await page.goto(f"https://boardgamearena.com/gamestats?player={player_id}&game=arknova")
+    await page.wait_for_load_state("networkidle")
+    await asyncio.sleep(2)  # Extra wait for dynamic content
+
+    return await page.evaluate("""
+        () => [...new Set(
+            [...document.querySelectorAll('a[href*="table="]')]
+            .map(a => a.href.match(/table=(\\d+)/)?.[1])
+            .filter(Boolean)
+        )]
+    """)
+
+
+async def get_table_ids_for_players(context, player_ids: list) -> list:
+    """Walk several players' gamestats pages at once and return each table once.
+
+    Tracked players share most tables, so IDs are de-duplicated here, before
+    any table page is visited.
+    """
+    pages = [await context.new_page() for _ in player_ids]
+    try:
+        histories = await asyncio.gather(
+            *(get_table_ids(page, pid) for page, pid in zip(pages, player_ids))
+        )
+    finally:
+        for page in pages:
+            await page.close()
+
+    seen = set()
+    table_ids = []
+    for history in histories:
+        for table_id in history:
+            if table_id not in seen:
+                seen.add(table_id)
+                table_ids.append(table_id)
+
+    listed = sum(len(h) for h in histories)
+    print(f"{listed} tables listed across {len(player_ids)} players, {len(table_ids)} unique "
+          f"({listed - len(table_ids)} duplicate fetches saved)")
+    return table_ids
+
+
+async def scrape_table(page, table_id: str):
+    """Stats for one finished table, or None if the page has no stats table."""
+    await page.goto(f"https://boardgamearena.com/table?table={table_id}")
+    await page.wait_for_load_state("networkidle")
+
+    # Wait for stats table to appear
+    try:
+        await page.wait_for_selector("table.statstable tr", timeout=10000)
+    except Exception:
+        return None
+
+    return await page.evaluate(STATS_TABLE_JS, table_id)
+
+
 async def login_and_save_session():
     """Use existing Chrome profile to get logged-in session."""
     import os
@@ -49,6 +149,7 @@ async def login_and_save_session():
     print("Launching Chrome with your existing profile...")
     print("NOTE: Close all other Chrome windows first!\n")
 
+    async_playwright = import_playwright()
     async with async_playwright() as p:
         # Launch with user's Chrome profile
         context = await p.chromium.launch_persistent_context(
@@ -64,9 +165,7 @@ async def login_and_save_session():
         await asyncio.sleep(3)
 
         # Check if logged in
-        is_logged_in = await page.evaluate("""
-            () => document.body.innerHTML.includes("'user_status': 'logged'")
-        """)
+        is_logged_in = await page.evaluate(LOGGED_IN_JS)
 
         if is_logged_in:
             print("Already logged in! Saving session...")
@@ -76,48 +175,35 @@ async def login_and_save_session():
             print("Not logged in. Please log in manually in the browser window.")
             print("Waiting up to 5 minutes...")
 
-            for i in range(300):
-                is_logged_in = await page.evaluate("""
-                    () => document.body.innerHTML.includes("'user_status': 'logged'")
-                """)
-                if is_logged_in:
-                    print("Login detected! Saving session...")
-                    await context.storage_state(path=str(AUTH_FILE))
-                    print(f"Session saved to {AUTH_FILE}")
-                    break
-                if i % 10 == 0:
-                    print(f"Waiting... ({i}s)")
-                await asyncio.sleep(1)
+            # Let the browser watch for the login instead of polling it every second
+            try:
+                await page.wait_for_function(LOGGED_IN_JS, timeout=300_000, polling=500)
+                print("Login detected! Saving session...")
+                await context.storage_state(path=str(AUTH_FILE))
+                print(f"Session saved to {AUTH_FILE}")
+            except Exception:
+                print("Timed out waiting for login.")
 
         await context.close()
 
 
-async def scrape_games(limit: int = None):
+async def scrape_games(limit: int = None, player_ids: list = None):
     """Scrape Ark Nova game statistics."""
     if not AUTH_FILE.exists():
         print("No saved session found. Run with --login first.")
         return
 
+    async_playwright = import_playwright()
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=False)  # Set to True for headless
         context = await browser.new_context(storage_state=str(AUTH_FILE))
         page = await context.new_page()
 
-        # Go to gamestats page
-        print("Loading game stats page...")
-        await page.goto(f"https://boardgamearena.com/gamestats?player={PLAYER_ID}&game=arknova")
-        await page.wait_for_load_state("networkidle")
-        await asyncio.sleep(2)  # Extra wait for dynamic content
-
-        # Get all table IDs
-        table_ids = await page.evaluate("""
-            () => [...new Set(
-                [...document.querySelectorAll('a[href*="table="]')]
-                .map(a => a.href.match(/table=(\\d+)/)?.[1])
-                .filter(Boolean)
-            )]
-        """)
-
+        player_ids = player_ids or [PLAYER_ID]
+        if len(player_ids) > 1:
+            table_ids = await get_table_ids_for_players(context, player_ids)
+        else:
+            table_ids = await get_table_ids(page, player_ids[0])
         print(f"Found {len(table_ids)} games")
 
         if limit:
@@ -130,51 +216,12 @@ async def scrape_games(limit: int = None):
             print(f"Processing game {i+1}/{len(table_ids)}: {table_id}")
 
             try:
-                # Navigate to game page
-                await page.goto(f"https://boardgamearena.com/table?table={table_id}")
-                await page.wait_for_load_state("networkidle")
-
-                # Wait for stats table to appear
-                try:
-                    await page.wait_for_selector("table.statstable tr", timeout=10000)
-                except:
-                    print(f"  No stats table found, skipping...")
-                    continue
-
-                # Extract stats
-                game_data = await page.evaluate("""
-                    (tableId) => {
-                        const rows = [...document.querySelectorAll('table.statstable tr')];
-                        if (rows.length === 0) return null;
-
-                        const data = rows.map(r =>
-                            [...r.querySelectorAll('td,th')].map(c => c.innerText.trim())
-                        );
-
-                        const players = data[0].slice(1);
-                        const stats = {};
-
-                        for (let i = 1; i < data.length; i++) {
-                            const statName = data[i][0];
-                            if (!statName || statName === 'All stats') continue;
-                            stats[statName] = {};
-                            players.forEach((p, j) => {
-                                stats[statName][p] = data[i][j + 1] || '';
-                            });
-                        }
-
-                        return {
-                            tableId: tableId,
-                            url: window.location.href,
-                            players: players,
-                            stats: stats
-                        };
-                    }
-                """, table_id)
-
+                game_data = await scrape_table(page, table_id)
                 if game_data:
                     all_games.append(game_data)
                     print(f"  Collected: {len(game_data['players'])} players, {len(game_data['stats'])} stats")
+                else:
+                    print(f"  No stats table found, skipping...")
 
                 # Small delay to be nice to the server
                 await asyncio.sleep(0.5)
@@ -188,7 +235,8 @@ async def scrape_games(limit: int = None):
         # Save results
         output = {
             "exportedAt": datetime.utcnow().isoformat() + "Z",
-            "playerId": PLAYER_ID,
+            "playerId": player_ids[0],
+            "playerIds": player_ids,
             "totalGames": len(all_games),
             "games": all_games
         }
@@ -204,12 +252,14 @@ async def main():
     parser = argparse.ArgumentParser(description="Scrape Ark Nova stats from BGA")
     parser.add_argument("--login", action="store_true", help="Open browser to log in and save session")
     parser.add_argument("--limit", type=int, help="Limit number of games to scrape")
+    parser.add_argument("--players", nargs="+", metavar="PLAYER_ID", default=[PLAYER_ID],
+                        help=f"Players whose histories to combine (default: {PLAYER_ID})")
     args = parser.parse_args()
 
     if args.login:
         await login_and_save_session()
     else:
-        await scrape_games(limit=args.limit)
+        await scrape_games(limit=args.limit, player_ids=args.players)
 
 
 if __name__ == "__main__":
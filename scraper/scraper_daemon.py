@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Keep a logged-in Playwright browser warm for frequent scheduled scrapes.
+
+Most of a short playwright_scraper.py run is spent launching Chromium and
+loading playwright_auth.json. The daemon does that once and then takes jobs
+over a local Unix socket. After every job the session's storage state is
+written back to playwright_auth.json, so cookies BGA refreshes are kept, and
+after --max-jobs jobs the browser is relaunched to stop memory creeping up.
+
+Scraped games are appended to scraper/new_games.json, ready for
+`scripts/merge_data.py` (or `scripts/build.py --watch`) to pick up.
+
+Usage:
+    1. Log in once: python playwright_scraper.py --login
+    2. Start the daemon: python scraper_daemon.py serve
+    3. From cron/launchd:
+         python scraper_daemon.py check            # list tables not collected yet
+         python scraper_daemon.py scrape           # scrape those into new_games.json
+         python scraper_daemon.py scrape 123 456   # scrape specific tables
+         python scraper_daemon.py ping
+         python scraper_daemon.py stop
+"""
+
+import asyncio
+import json
+import socket
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from playwright_scraper import (
+    AUTH_FILE, PLAYER_ID, import_playwright, get_table_ids, scrape_table,
+)
+
+REPO_ROOT = Path(__file__).parent.parent
+DETAILED_GAMES_FILE = REPO_ROOT / "docs" / "data" / "detailed_games.json"
+NEW_GAMES_FILE = Path(__file__).parent / "new_games.json"
+
+# Kept out of the repo, and short enough for the macOS socket path limit
+SOCKET_PATH = Path(tempfile.gettempdir()) / "arknova_scraper.sock"
+
+
+def load_games(path: Path) -> list:
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return json.load(f).get("games", [])
+
+
+def known_table_ids() -> set:
+    """Tables already published or already waiting in new_games.json."""
+    return {g["tableId"] for g in load_games(DETAILED_GAMES_FILE) + load_games(NEW_GAMES_FILE)}
+
+
+def append_new_games(games: list):
+    """Add games to scraper/new_games.json, skipping ones already there."""
+    existing = load_games(NEW_GAMES_FILE)
+    existing_ids = {g["tableId"] for g in existing}
+    existing.extend(g for g in games if g["tableId"] not in existing_ids)
+    with open(NEW_GAMES_FILE, "w") as f:
+        json.dump({"games": existing}, f, indent=2)
+
+
+class ScraperDaemon:
+    def __init__(self, socket_path: Path = SOCKET_PATH, max_jobs: int = 50,
+                 headless: bool = True, player_id: str = PLAYER_ID):
+        self.socket_path = socket_path
+        self.max_jobs = max_jobs
+        self.headless = headless
+        self.player_id = player_id
+
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+
+        self.jobs_since_launch = 0
+        self.total_jobs = 0
+        self.started_at = time.time()
+        self.lock = asyncio.Lock()  # one page, so jobs run one at a time
+        self.stopping = asyncio.Event()
+
+    async def start_browser(self):
+        print("Launching browser...")
+        self.playwright = await import_playwright()().start()
+        self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        self.context = await self.browser.new_context(storage_state=str(AUTH_FILE))
+        self.page = await self.context.new_page()
+        self.jobs_since_launch = 0
+
+    async def stop_browser(self):
+        if self.context:
+            try:
+                await self.save_session()
+            except Exception as e:
+                print(f"Could not save session: {e}")
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+        self.playwright = self.browser = self.context = self.page = None
+
+    async def recycle_browser(self):
+        await self.stop_browser()
+        await self.start_browser()
+
+    async def save_session(self):
+        """Write refreshed cookies back so the next launch starts logged in."""
+        await self.context.storage_state(path=str(AUTH_FILE))
+
+    async def run_job(self, request: dict) -> dict:
+        job = request.get("job")
+        if job == "ping":
+            return {"ok": True, "jobs": self.total_jobs,
+                    "uptime": round(time.time() - self.started_at)}
+        if job == "stop":
+            self.stopping.set()
+            return {"ok": True}
+        if job not in ("check", "scrape"):
+            return {"ok": False, "error": f"Unknown job: {job}"}
+
+        async with self.lock:
+            try:
+                if job == "check":
+                    result = {"ok": True, "new": await self.check()}
+                else:
+                    result = await self.scrape(request.get("tableIds"))
+                await self.save_session()
+            except Exception:
+                # A crashed page or failed navigation can leave the page
+                # unusable, so the next job gets a fresh browser
+                self.total_jobs += 1
+                print(f"{job} job failed, relaunching browser")
+                await self.recycle_browser()
+                raise
+            self.total_jobs += 1
+            self.jobs_since_launch += 1
+
+            if self.jobs_since_launch >= self.max_jobs:
+                print(f"Recycling browser after {self.jobs_since_launch} jobs")
+                await self.recycle_browser()
+            return result
+
+    async def check(self) -> list:
+        """Table IDs on the gamestats page that haven't been collected yet."""
+        known = known_table_ids()
+        return [t for t in await get_table_ids(self.page, self.player_id) if t not in known]
+
+    async def scrape(self, table_ids: list = None) -> dict:
+        if not table_ids:
+            table_ids = await self.check()
+
+        scraped, skipped = [], []
+        for table_id in table_ids:
+            print(f"Scraping {table_id}")
+            try:
+                game_data = await scrape_table(self.page, table_id)
+            except Exception as e:
+                print(f"  Error: {e}")
+                game_data = None
+            if game_data:
+                scraped.append(game_data)
+            else:
+                skipped.append(table_id)
+
+            # Small delay to be nice to the server
+            await asyncio.sleep(0.5)
+
+        if scraped:
+            append_new_games(scraped)
+        return {"ok": True, "scraped": [g["tableId"] for g in scraped], "skipped": skipped}
+
+    async def handle_client(self, reader, writer):
+        try:
+            request = json.loads(await reader.readline())
+            response = await self.run_job(request)
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        try:
+            writer.write((json.dumps(response) + "\n").encode())
+            await writer.drain()
+        except ConnectionError:
+            print("Client went away before the reply was sent")
+        writer.close()
+
+    async def serve(self):
+        if not AUTH_FILE.exists():
+            print("No saved session found. Run playwright_scraper.py --login first.")
+            return
+
+        if self.socket_path.exists():
+            try:
+                send_job({"job": "ping"}, self.socket_path, timeout=2)
+                print(f"A daemon is already listening on {self.socket_path}")
+                return
+            except (OSError, ValueError):
+                # Left over from a crashed daemon (nothing listening, or a
+                # half-dead listener that closes without a reply)
+                self.socket_path.unlink()
+
+        await self.start_browser()
+        server = await asyncio.start_unix_server(self.handle_client, path=str(self.socket_path))
+        print(f"Listening on {self.socket_path} (recycling every {self.max_jobs} jobs)")
+
+        try:
+            async with server:
+                await self.stopping.wait()
+        finally:
+            await self.stop_browser()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            print("Daemon stopped.")
+
+
+def send_job(request: dict, socket_path: Path = SOCKET_PATH, timeout: float = 600) -> dict:
+    """Send one job to a running daemon and wait for its reply (timeout=None waits forever)."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall((json.dumps(request) + "\n").encode())
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            reply += chunk
+    return json.loads(reply)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Warm Playwright scraper daemon")
+    parser.add_argument("command", choices=["serve", "check", "scrape", "ping", "stop"])
+    parser.add_argument("table_ids", nargs="*", help="Tables to scrape (default: all new ones)")
+    parser.add_argument("--socket", default=str(SOCKET_PATH), help="Unix socket path")
+    parser.add_argument("--max-jobs", type=int, default=50,
+                        help="Relaunch the browser after this many jobs (default: 50)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--player", default=PLAYER_ID, help="Player whose gamestats page to check")
+    args = parser.parse_args()
+
+    socket_path = Path(args.socket)
+
+    if args.command == "serve":
+        daemon = ScraperDaemon(socket_path, args.max_jobs, not args.headed, args.player)
+        await daemon.serve()
+        return
+
+    request = {"job": args.command}
+    if args.table_ids:
+        request["tableIds"] = args.table_ids
+
+    # A scrape takes as long as the tables it has to visit, so it gets no
+    # read timeout; the other jobs answer quickly
+    timeout = None if args.command == "scrape" else 600
+    try:
+        response = send_job(request, socket_path, timeout=timeout)
+    except socket.timeout:
+        # Before OSError: socket.timeout is one, but the daemon is running
+        print(f"No reply from the daemon within {timeout}s; it may still be working")
+        exit(1)
+    except OSError:
+        print("Scraper daemon is not running. Start it with: python scraper_daemon.py serve")
+        exit(1)
+
+    if not response.get("ok"):
+        print(f"Error: {response.get('error')}")
+        exit(1)
+
+    if args.command == "check":
+        print(f"{len(response['new'])} new game(s)")
+        for table_id in response["new"]:
+            print(f"  {table_id}")
+    elif args.command == "scrape":
+        print(f"Scraped {len(response['scraped'])} game(s) into {NEW_GAMES_FILE}")
+        if response["skipped"]:
+            print(f"  No stats for: {', '.join(response['skipped'])}")
+    elif args.command == "ping":
+        print(f"Daemon up for {response['uptime']}s, {response['jobs']} job(s) run")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,30 +1,62 @@
 #!/usr/bin/env python3
+"""
+Count which cards each player plays, using the collected game logs.
+
+Usage:
+  python scripts/analyze_cards.py                   # default log/output locations
+  python scripts/analyze_cards.py --logs LOGS.json --output OUT.json
+  python scripts/analyze_cards.py --jobs 0          # one worker process per CPU
+"""
+
+import os
 import json
 import re
+import argparse
+from pathlib import Path
 from collections import defaultdict
 
-# Load game logs
-with open('./docs/data/detailed_game_logs.json', 'r') as f:
-    logs_data = json.load(f)
+REPO_ROOT = Path(__file__).parent.parent
+DOCS_DATA_DIR = REPO_ROOT / "docs" / "data"
 
-# Track cards played per player
-player_cards = defaultdict(lambda: defaultdict(int))
+DEFAULT_LOGS = DOCS_DATA_DIR / "detailed_game_logs.json"
+DEFAULT_OUTPUT = DOCS_DATA_DIR / "card_analysis.json"
 
-# Track cards per game per player
-game_cards = defaultdict(lambda: defaultdict(list))
+TRACKED_PLAYERS = ['msiebert', 'marksbrt', 'AstroHood', 'siebert23']
 
 # Regex to match card plays
 # Patterns:
 # "[Player] plays [Card Name]"
 # "[Player] plays [Card Name] for X and places it..."
-play_pattern = re.compile(r'^(\w+) plays ([A-Z][^0-9]+?)(?:\s+for \d+|\s*$)')
+PLAY_PATTERN = re.compile(r'^(\w+) plays ([A-Z][^0-9]+?)(?:\s+for \d+|\s*$)')
+
+
+def play_lines(games: list) -> list:
+    """[(table_id, [actions that may be card plays])] for a list of logs.
+
+    Every card play contains ' plays ', and that substring test is far
+    cheaper than the regex, so only a few percent of the actions are left to
+    match (or to pickle for a worker process).
+    """
+    return [
+        (game['tableId'], [action for entry in game.get('logEntries', [])
+                           for action in entry.get('actions', []) if ' plays ' in action])
+        for game in games
+    ]
 
-for game in logs_data['logs']:
-    table_id = game['tableId']
 
-    for entry in game.get('logEntries', []):
-        for action in entry.get('actions', []):
-            match = play_pattern.match(action)
+def count_chunk(games: list):
+    """Card plays for a chunk of play_lines() output, as plain (picklable) counters.
+
+    Returns ({player: {card: plays}}, [(table_id, {player: [cards]})]), with
+    keys in the order they were first seen so chunks can be merged
+    deterministically.
+    """
+    player_cards = {}
+    game_cards = {}
+
+    for table_id, actions in games:
+        for action in actions:
+            match = PLAY_PATTERN.match(action)
             if match:
                 player = match.group(1)
                 card_name = match.group(2).strip()
@@ -40,52 +72,141 @@ for game in logs_data['logs']:
                 if 'standard project' in card_name.lower():
                     continue
 
-                player_cards[player][card_name] += 1
-                game_cards[table_id][player].append(card_name)
+                counts = player_cards.setdefault(player, {})
+                counts[card_name] = counts.get(card_name, 0) + 1
+                game_cards.setdefault(table_id, {}).setdefault(player, []).append(card_name)
 
-# Output cards per game per player
-print('=== CARDS PLAYED PER GAME ===\n')
-for i, (table_id, players) in enumerate(list(game_cards.items())[:5]):
-    print(f'\nGame {table_id}:')
-    for player, cards in players.items():
-        if cards:
-            print(f'  {player}: {", ".join(cards)}')
-print('\n... (showing first 5 games)\n')
+    return player_cards, list(game_cards.items())
 
-# Output top 10 cards per player
-print('\n=== TOP 10 MOST PLAYED CARDS PER PLAYER (min 2 plays) ===\n')
 
-tracked_players = ['msiebert', 'marksbrt', 'AstroHood', 'siebert23']
+def map_games(func, games: list, jobs: int = 1, chunksize: int = None) -> list:
+    """Apply func to consecutive chunks of games, returning results in chunk order.
 
-for player in tracked_players:
-    if player not in player_cards:
-        continue
+    With jobs > 1 the chunks are spread over a process pool; func must be a
+    module-level function. Chunks default to about four per worker, which
+    keeps pickling overhead low while still balancing uneven games.
+    """
+    if not games:
+        return []
+    if jobs is None or jobs < 1:
+        jobs = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, -(-len(games) // (jobs * 4)))
 
-    cards = [(name, count) for name, count in player_cards[player].items() if count >= 2]
-    cards.sort(key=lambda x: -x[1])
-    cards = cards[:10]
+    chunks = [games[i:i + chunksize] for i in range(0, len(games), chunksize)]
+    if jobs == 1 or len(chunks) == 1:
+        return [func(chunk) for chunk in chunks]
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+        return list(pool.map(func, chunks))
 
-    print(f'{player}:')
-    for idx, (name, count) in enumerate(cards):
-        print(f'  {idx + 1}. {name} ({count} plays)')
-    print('')
 
-# Save full data to JSON
-output = {
-    'generatedAt': '',
-    'cardsPerGame': {k: dict(v) for k, v in game_cards.items()},
-    'topCardsByPlayer': {}
-}
+def extract_card_plays(logs: list, jobs: int = 1):
+    """Return (cards played per player, cards per game per player) for a list of logs.
 
-for player in tracked_players:
-    if player not in player_cards:
-        continue
+    The result is the same for any number of jobs: partial counters are merged
+    in chunk order, so first-seen ordering matches a serial pass.
+    """
+    # Track cards played per player
+    player_cards = defaultdict(lambda: defaultdict(int))
 
-    cards = [(name, count) for name, count in player_cards[player].items() if count >= 2]
+    # Track cards per game per player
+    game_cards = defaultdict(lambda: defaultdict(list))
+
+    for partial_players, partial_games in map_games(count_chunk, play_lines(logs), jobs):
+        for player, counts in partial_players.items():
+            for card_name, plays in counts.items():
+                player_cards[player][card_name] += plays
+        for table_id, players in partial_games:
+            for player, cards in players.items():
+                game_cards[table_id][player].extend(cards)
+
+    return player_cards, game_cards
+
+
+def top_cards(player_cards, player: str, min_plays: int = 2) -> list:
+    """Cards a player has played at least min_plays times, most played first."""
+    cards = [(name, count) for name, count in player_cards[player].items() if count >= min_plays]
     cards.sort(key=lambda x: -x[1])
-    output['topCardsByPlayer'][player] = [{'card': name, 'plays': count} for name, count in cards]
+    return cards
+
+
+def print_summary(player_cards, game_cards):
+    """Print a sample of cards per game and each tracked player's top 10."""
+    # Output cards per game per player
+    print('=== CARDS PLAYED PER GAME ===\n')
+    for i, (table_id, players) in enumerate(list(game_cards.items())[:5]):
+        print(f'\nGame {table_id}:')
+        for player, cards in players.items():
+            if cards:
+                print(f'  {player}: {", ".join(cards)}')
+    print('\n... (showing first 5 games)\n')
+
+    # Output top 10 cards per player
+    print('\n=== TOP 10 MOST PLAYED CARDS PER PLAYER (min 2 plays) ===\n')
+
+    for player in TRACKED_PLAYERS:
+        if player not in player_cards:
+            continue
+
+        print(f'{player}:')
+        for idx, (name, count) in enumerate(top_cards(player_cards, player)[:10]):
+            print(f'  {idx + 1}. {name} ({count} plays)')
+        print('')
+
+
+def build_output(player_cards, game_cards) -> dict:
+    """Build the card_analysis.json document."""
+    output = {
+        'generatedAt': '',
+        'cardsPerGame': {k: dict(v) for k, v in game_cards.items()},
+        'topCardsByPlayer': {}
+    }
+
+    for player in TRACKED_PLAYERS:
+        if player not in player_cards:
+            continue
+
+        output['topCardsByPlayer'][player] = [
+            {'card': name, 'plays': count} for name, count in top_cards(player_cards, player)
+        ]
+
+    return output
+
+
+def analyze(logs_path=DEFAULT_LOGS, output_path=DEFAULT_OUTPUT, verbose: bool = True,
+            jobs: int = 1) -> dict:
+    """Analyze card plays in logs_path and save the result to output_path."""
+    with open(logs_path, 'r') as f:
+        logs_data = json.load(f)
+
+    player_cards, game_cards = extract_card_plays(logs_data['logs'], jobs=jobs)
+
+    if verbose:
+        print_summary(player_cards, game_cards)
+
+    output = build_output(player_cards, game_cards)
+
+    with open(output_path, 'w') as f:
+        json.dump(output, f, indent=2)
+
+    print(f'Full analysis saved to {output_path}')
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyze card plays from game logs')
+    parser.add_argument('--logs', default=str(DEFAULT_LOGS),
+                        help='Game logs file (default: docs/data/detailed_game_logs.json)')
+    parser.add_argument('--output', '-o', default=str(DEFAULT_OUTPUT),
+                        help='Output file (default: docs/data/card_analysis.json)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes (default: 1, 0 = one per CPU)')
+    args = parser.parse_args()
+
+    analyze(args.logs, args.output, jobs=args.jobs)
 
-with open('./docs/data/card_analysis.json', 'w') as f:
-    json.dump(output, f, indent=2)
 
-print('Full analysis saved to docs/data/card_analysis.json')
+if __name__ == '__main__':
+    main()
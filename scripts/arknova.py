@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the Ark Nova stats tools.
+
+Usage:
+  python scripts/arknova.py scrape --cookies cookies.json   # scraper/bga_scraper.py
+  python scripts/arknova.py scrape-browser [--login]        # scraper/playwright_scraper.py
+  python scripts/arknova.py scrape-daemon serve|check|scrape # scraper/scraper_daemon.py
+  python scripts/arknova.py collect-logs --cookies c.json   # scraper/log_collector.py
+  python scripts/arknova.py merge [--games] [--logs]        # scripts/merge_data.py
+  python scripts/arknova.py analyze [--jobs N]              # scripts/analyze_cards.py
+  python scripts/arknova.py sequences [--after CARD]         # scripts/sequences.py
+  python scripts/arknova.py build [--watch]                 # scripts/build.py
+  python scripts/arknova.py query [--player NAME]           # scripts/query.py
+  python scripts/arknova.py serve [--port 8765]             # scripts/query_server.py
+
+Arguments after the subcommand are passed straight to that tool; use
+`arknova.py SUBCOMMAND --help` for its options. A subcommand's module is only
+imported when it runs, so `--help`, merge and query start without loading
+requests or Playwright.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+SCRAPER_DIR = REPO_ROOT / "scraper"
+
+# subcommand -> (directory, module, description)
+COMMANDS = {
+    "scrape": (SCRAPER_DIR, "bga_scraper", "Fetch game history with exported BGA cookies"),
+    "scrape-browser": (SCRAPER_DIR, "playwright_scraper", "Scrape detailed stats with Playwright"),
+    "scrape-daemon": (SCRAPER_DIR, "scraper_daemon", "Keep a warm browser for scheduled scrapes"),
+    "collect-logs": (SCRAPER_DIR, "log_collector", "Fetch missing game logs with BGA cookies"),
+    "merge": (SCRIPTS_DIR, "merge_data", "Merge new games/logs into docs/data"),
+    "analyze": (SCRIPTS_DIR, "analyze_cards", "Count card plays from the game logs"),
+    "sequences": (SCRIPTS_DIR, "sequences", "Mine card play sequences and their win rates"),
+    "build": (SCRIPTS_DIR, "build", "Rebuild stale derived data files"),
+    "query": (SCRIPTS_DIR, "query", "Filter and summarize collected games"),
+    "serve": (SCRIPTS_DIR, "query_server", "Serve cached JSON queries over HTTP"),
+}
+
+
+def run_command(name: str, argv: list):
+    """Import the tool behind a subcommand and run its main() with argv."""
+    directory, module_name, _ = COMMANDS[name]
+    if str(directory) not in sys.path:
+        sys.path.insert(0, str(directory))
+
+    module = __import__(module_name)
+    sys.argv = [f"arknova {name}"] + argv
+    result = module.main()
+
+    # The Playwright tools' main() is a coroutine
+    if hasattr(result, "__await__"):
+        import asyncio
+        result = asyncio.run(result)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="arknova",
+        description="Ark Nova stats tools",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands:\n" + "\n".join(
+            f"  {name:16}{desc}" for name, (_, _, desc) in COMMANDS.items()
+        ),
+    )
+    parser.add_argument("command", choices=COMMANDS, metavar="command",
+                        help="One of: " + ", ".join(COMMANDS))
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the command")
+    args = parser.parse_args()
+
+    run_command(args.command, args.args)
+
+
+if __name__ == "__main__":
+    main()
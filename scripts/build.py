@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Rebuild derived data files, skipping anything that is already up to date.
+
+Every derived file is produced by a node in a small dependency graph. After a
+node builds successfully, the content hashes of its inputs and outputs are
+recorded in .build_state.json. On the next run a node is only rebuilt when one
+of those hashes has changed (or an output is missing). Nodes whose
+dependencies are finished run in parallel, each in its own process.
+
+Usage:
+  python scripts/build.py              # rebuild stale nodes
+  python scripts/build.py --force      # rebuild every node
+  python scripts/build.py --list       # show nodes and whether they are stale
+  python scripts/build.py --watch      # rebuild when new_games/new_logs change
+  python scripts/build.py card_analysis  # rebuild one node (and its stale deps)
+"""
+
+import json
+import time
+import hashlib
+import argparse
+from pathlib import Path
+
+import merge_data
+import analyze_cards
+import sequences
+
+REPO_ROOT = Path(__file__).parent.parent
+STATE_FILE = REPO_ROOT / ".build_state.json"
+
+DETAILED_GAMES = merge_data.DOCS_DATA_DIR / "detailed_games.json"
+DETAILED_LOGS = merge_data.DOCS_DATA_DIR / "detailed_game_logs.json"
+
+
+def build_games(jobs: int = None):
+    """Merge scraper/new_games.json into detailed_games.json."""
+    if merge_data.merge_games(str(merge_data.DEFAULT_NEW_GAMES)) > 0:
+        merge_data.clear_file(merge_data.DEFAULT_NEW_GAMES)
+
+
+def build_logs(jobs: int = None):
+    """Merge scraper/new_logs.json into detailed_game_logs.json."""
+    if merge_data.merge_logs(str(merge_data.DEFAULT_NEW_LOGS)) > 0:
+        merge_data.clear_file(merge_data.DEFAULT_NEW_LOGS)
+
+
+def build_card_analysis(jobs: int = None):
+    """Regenerate card_analysis.json from the game logs, on up to jobs processes."""
+    analyze_cards.analyze(DETAILED_LOGS, analyze_cards.DEFAULT_OUTPUT, verbose=False,
+                          jobs=jobs or 0)
+
+
+def build_card_sequences(jobs: int = None):
+    """Add newly logged games to the card sequence index."""
+    sequences.update_index(DETAILED_LOGS, DETAILED_GAMES, sequences.DEFAULT_INDEX)
+
+
+class Node:
+    """A build step: the files it reads, the files it writes, and how to make them."""
+
+    def __init__(self, name: str, action, inputs: list, outputs: list, deps: list = ()):
+        self.name = name
+        self.action = action
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs]
+        self.deps = list(deps)
+
+    def tracked_files(self) -> list:
+        return self.inputs + [p for p in self.outputs if p not in self.inputs]
+
+    def missing_inputs(self) -> list:
+        return [p.name for p in self.inputs if not p.exists()]
+
+
+# Add new aggregate outputs here. Actions must be module-level functions so
+# they can be sent to worker processes; each is called with the build's
+# --jobs value (None = one per CPU) for steps that can use their own workers.
+NODES = [
+    Node("games", build_games,
+         inputs=[merge_data.DEFAULT_NEW_GAMES],
+         outputs=[DETAILED_GAMES]),
+    Node("logs", build_logs,
+         inputs=[merge_data.DEFAULT_NEW_LOGS],
+         outputs=[DETAILED_LOGS]),
+    Node("card_analysis", build_card_analysis,
+         inputs=[DETAILED_LOGS],
+         outputs=[analyze_cards.DEFAULT_OUTPUT],
+         deps=["logs"]),
+    Node("card_sequences", build_card_sequences,
+         inputs=[DETAILED_LOGS, DETAILED_GAMES],
+         outputs=[sequences.DEFAULT_INDEX],
+         deps=["games", "logs"]),
+]
+
+# Files that trigger a rebuild in --watch mode
+WATCHED_FILES = [merge_data.DEFAULT_NEW_GAMES, merge_data.DEFAULT_NEW_LOGS]
+
+
+def file_hash(path: Path):
+    """SHA-256 of a file's contents, or None if it doesn't exist."""
+    if not path.exists():
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_state() -> dict:
+    if not STATE_FILE.exists():
+        return {}
+    try:
+        with open(STATE_FILE, 'r') as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        return {}
+
+
+def save_state(state: dict):
+    tmp_path = STATE_FILE.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    tmp_path.replace(STATE_FILE)
+
+
+def current_hashes(node: Node) -> dict:
+    return {str(p.relative_to(REPO_ROOT)): file_hash(p) for p in node.tracked_files()}
+
+
+def stale_reason(node: Node, state: dict):
+    """Why a node needs rebuilding, or None if it is up to date."""
+    if any(not p.exists() for p in node.outputs):
+        return "output missing"
+    recorded = state.get(node.name)
+    if recorded is None:
+        return "never built"
+    for path, digest in current_hashes(node).items():
+        if recorded.get(path) != digest:
+            return f"{path} changed"
+    return None
+
+
+def select_nodes(targets: list) -> list:
+    """The requested nodes plus everything they depend on, in graph order."""
+    by_name = {n.name: n for n in NODES}
+    unknown = [t for t in targets if t not in by_name]
+    if unknown:
+        raise SystemExit(f"Unknown node(s): {', '.join(unknown)}")
+
+    wanted = set()
+    pending = list(targets) if targets else list(by_name)
+    while pending:
+        name = pending.pop()
+        if name not in wanted:
+            wanted.add(name)
+            pending.extend(by_name[name].deps)
+    return [n for n in NODES if n.name in wanted]
+
+
+def build(targets: list = (), force: bool = False, jobs: int = None) -> bool:
+    """Rebuild stale nodes. Returns False if any node failed."""
+    # Imported here so --list and `arknova` startup don't pay for multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    nodes = select_nodes(list(targets))
+    state = load_state()
+
+    done, failed, rebuilt = set(), set(), []
+    running = {}
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while len(done) + len(failed) < len(nodes):
+            for node in nodes:
+                if node.name in done or node.name in failed or node.name in running.values():
+                    continue
+                if any(d in failed for d in node.deps):
+                    print(f"[skip] {node.name}: dependency failed")
+                    failed.add(node.name)
+                    continue
+                if not all(d in done for d in node.deps):
+                    continue
+
+                # Decided only once deps are finished, since they may change our inputs
+                missing = node.missing_inputs()
+                reason = "forced" if force else stale_reason(node, state)
+                if missing:
+                    print(f"[skip] {node.name}: missing {', '.join(missing)}")
+                    done.add(node.name)
+                elif reason is None:
+                    print(f"[ok]   {node.name}")
+                    done.add(node.name)
+                else:
+                    print(f"[run]  {node.name} ({reason})")
+                    running[pool.submit(node.action, jobs)] = node.name
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"[fail] {name}: {e}")
+                    failed.add(name)
+                    continue
+                node = next(n for n in nodes if n.name == name)
+                state[name] = current_hashes(node)
+                save_state(state)
+                done.add(name)
+                rebuilt.append(name)
+
+    print(f"\nRebuilt {len(rebuilt)} node(s)" + (f": {', '.join(rebuilt)}" if rebuilt else ""))
+    if failed:
+        print(f"Failed: {', '.join(sorted(failed))}")
+    return not failed
+
+
+def list_nodes():
+    state = load_state()
+    for node in NODES:
+        missing = node.missing_inputs()
+        reason = f"missing {', '.join(missing)}" if missing else stale_reason(node, state)
+        deps = f" (after {', '.join(node.deps)})" if node.deps else ""
+        print(f"{node.name}{deps}: {reason or 'up to date'}")
+
+
+def watch(interval: float, jobs: int = None):
+    """Poll the scraper drop files and rebuild whenever one of them changes."""
+    print(f"Watching {', '.join(p.name for p in WATCHED_FILES)} (Ctrl+C to stop)")
+    build(jobs=jobs)
+    last = {p: file_hash(p) for p in WATCHED_FILES}
+    try:
+        while True:
+            time.sleep(interval)
+            current = {p: file_hash(p) for p in WATCHED_FILES}
+            if current != last:
+                changed = [p.name for p in WATCHED_FILES if current[p] != last[p]]
+                print(f"\n{', '.join(changed)} changed, rebuilding...")
+                build(jobs=jobs)
+                # The merge clears the drop files, so re-read after building
+                current = {p: file_hash(p) for p in WATCHED_FILES}
+            last = current
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild stale derived data files')
+    parser.add_argument('targets', nargs='*', help='Nodes to build (default: all)')
+    parser.add_argument('--force', '-f', action='store_true', help='Rebuild even if up to date')
+    parser.add_argument('--list', action='store_true', help='List nodes and their status')
+    parser.add_argument('--watch', '-w', action='store_true',
+                        help='Rebuild whenever scraper/new_games.json or new_logs.json changes')
+    parser.add_argument('--interval', type=float, default=2.0,
+                        help='Seconds between checks in --watch mode (default: 2)')
+    parser.add_argument('--jobs', '-j', type=int,
+                        help='Max parallel processes, for nodes and for card_analysis workers (default: one per CPU)')
+    args = parser.parse_args()
+
+    if args.list:
+        list_nodes()
+    elif args.watch:
+        watch(args.interval, jobs=args.jobs)
+    elif not build(args.targets, force=args.force, jobs=args.jobs):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,9 +6,17 @@ Usage:
   python scripts/merge_data.py              # merges both from default locations
   python scripts/merge_data.py --games      # merge only games
   python scripts/merge_data.py --logs       # merge only logs
+
+A game or log whose tableId is already present replaces the stored one only if
+its content hash differs; files are not rewritten when nothing changed. The
+per-record hashes are kept in .record_hashes.games.json and
+.record_hashes.logs.json so downstream steps (like sequences.py) can tell which
+games and logs changed.
 """
 
 import json
+import hashlib
+import os
 import argparse
 from pathlib import Path
 from datetime import datetime
@@ -20,79 +28,188 @@ SCRAPER_DIR = REPO_ROOT / "scraper"
 DEFAULT_NEW_GAMES = SCRAPER_DIR / "new_games.json"
 DEFAULT_NEW_LOGS = SCRAPER_DIR / "new_logs.json"
 
+# Fields that differ between two collections of the same game or log:
+# collectedAt is stamped on every log fetch, and url is derived from the
+# tableId but spelled differently by each collector (the page URL in the
+# Tampermonkey scripts, a built table/gamereview URL in the Python ones)
+VOLATILE_FIELDS = {'collectedAt', 'url'}
+
+# Per-record hashes of the data files, keyed by the SHA-256 of the file they
+# were computed from, so a stale entry (e.g. after a hand edit) is ignored.
+# One file per kind: build.py merges games and logs in parallel processes.
+HASHES_FILE_PATTERN = ".record_hashes.{kind}.json"
+
+
+def record_hash(record: dict) -> str:
+    """SHA-256 of a game or log's content, ignoring volatile fields and key order."""
+    content = {k: v for k, v in record.items() if k not in VOLATILE_FIELDS}
+    data = json.dumps(content, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def file_digest(path: Path):
+    """SHA-256 of a file's contents, or None if it doesn't exist."""
+    if not path.exists():
+        return None
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def hashes_file(kind: str) -> Path:
+    return REPO_ROOT / HASHES_FILE_PATTERN.format(kind=kind)
+
+
+def load_hash_file(kind: str) -> dict:
+    try:
+        with open(hashes_file(kind), 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def record_hashes(kind: str, path, records: list) -> dict:
+    """{tableId: record_hash} for the records of a data file ('games' or 'logs').
+
+    Taken from the kind's hash file when it was written for the file's
+    current contents, otherwise computed from the records.
+    """
+    entry = load_hash_file(kind)
+    if entry.get('file') and entry['file'] == file_digest(Path(path)):
+        return dict(entry['records'])
+    hashes = {}
+    for record in records:
+        hashes.setdefault(record['tableId'], record_hash(record))
+    return hashes
+
+
+def save_record_hashes(kind: str, digest: str, hashes: dict):
+    """Store the record hashes of a data file whose SHA-256 is digest."""
+    entry = {'file': digest, 'records': hashes}
+    if load_hash_file(kind) != entry:
+        save_json(hashes_file(kind), entry)
+
+
+def merge_records(existing: list, incoming: list, hashes: dict = None) -> tuple:
+    """Add new records to existing and replace ones whose content changed.
+
+    hashes ({tableId: record_hash} of existing, filled in as needed) is
+    updated in place. Returns (added_ids, changed_ids, unchanged_count).
+    """
+    positions = {r['tableId']: i for i, r in reversed(list(enumerate(existing)))}
+    if hashes is None:
+        hashes = {}
+    added, changed, unchanged = [], [], 0
+
+    for record in incoming:
+        table_id = record['tableId']
+        if table_id not in positions:
+            positions[table_id] = len(existing)
+            hashes[table_id] = record_hash(record)
+            existing.append(record)
+            added.append(table_id)
+            continue
+
+        i = positions[table_id]
+        if table_id not in hashes:
+            hashes[table_id] = record_hash(existing[i])
+        new_hash = record_hash(record)
+        if new_hash == hashes[table_id]:
+            unchanged += 1
+        else:
+            existing[i] = record
+            hashes[table_id] = new_hash
+            if table_id not in added and table_id not in changed:
+                changed.append(table_id)
+
+    return added, changed, unchanged
+
+
+def save_json(path: Path, data: dict) -> str:
+    """Write via a temp file so readers never see a half-written file.
+
+    Returns the SHA-256 of what was written.
+    """
+    text = json.dumps(data, indent=2)
+    # Per-process temp name, so two processes saving at once can't replace
+    # each other's half-written file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    tmp_path.replace(path)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def report(kind: str, added: list, changed: list, unchanged: int, total: int):
+    print(f"{kind}: Added {len(added)} new, updated {len(changed)}, "
+          f"{unchanged} unchanged (total: {total})")
+    if added:
+        print(f"  New IDs: {', '.join(added)}")
+    if changed:
+        print(f"  Updated IDs: {', '.join(changed)}")
+
+
 def merge_games(new_games_path: str):
-    """Merge new games into detailed_games.json"""
+    """Merge new and changed games into detailed_games.json.
+
+    The file is only rewritten (and exportedAt only bumped) when a game was
+    added or changed, so an empty or repeated merge leaves it byte-identical.
+    Returns the number of games added or updated.
+    """
     existing_path = DOCS_DATA_DIR / "detailed_games.json"
 
     # Load existing data
     with open(existing_path, 'r') as f:
         existing = json.load(f)
 
-    existing_ids = {g['tableId'] for g in existing['games']}
-
     # Load new data
     with open(new_games_path, 'r') as f:
         new_data = json.load(f)
 
-    new_games = new_data.get('games', [])
+    hashes = record_hashes('games', existing_path, existing['games'])
+    added, updated, unchanged = merge_records(existing['games'], new_data.get('games', []), hashes)
 
-    # Filter to truly new games
-    added = []
-    for game in new_games:
-        if game['tableId'] not in existing_ids:
-            existing['games'].append(game)
-            added.append(game['tableId'])
-            existing_ids.add(game['tableId'])
+    digest = file_digest(existing_path)
+    if added or updated:
+        existing['exportedAt'] = datetime.now().isoformat() + 'Z'
+        existing['totalGames'] = len(existing['games'])
+        digest = save_json(existing_path, existing)
+    save_record_hashes('games', digest, hashes)
 
-    # Update metadata
-    existing['exportedAt'] = datetime.now().isoformat() + 'Z'
-    existing['totalGames'] = len(existing['games'])
-
-    # Save
-    with open(existing_path, 'w') as f:
-        json.dump(existing, f, indent=2)
-
-    print(f"Games: Added {len(added)} new games (total: {existing['totalGames']})")
-    if added:
-        print(f"  New IDs: {', '.join(added)}")
-    return len(added)
+    report("Games", added, updated, unchanged, len(existing['games']))
+    return len(added) + len(updated)
 
 def merge_logs(new_logs_path: str):
-    """Merge new logs into detailed_game_logs.json"""
-    existing_path = DOCS_DATA_DIR / "detailed_game_logs.json"
+    """Merge new and changed logs into detailed_game_logs.json.
 
-    # Load existing data
-    with open(existing_path, 'r') as f:
-        existing = json.load(f)
+    Like merge_games, the file is left untouched when nothing changed.
+    Returns the number of logs added or updated.
+    """
+    existing_path = DOCS_DATA_DIR / "detailed_game_logs.json"
 
-    existing_ids = {g['tableId'] for g in existing['logs']}
+    # Load existing data (the log store is created on the first merge)
+    created = not existing_path.exists()
+    if created:
+        existing = {'exportedAt': '', 'totalLogs': 0, 'logs': []}
+    else:
+        with open(existing_path, 'r') as f:
+            existing = json.load(f)
 
     # Load new data
     with open(new_logs_path, 'r') as f:
         new_data = json.load(f)
 
-    new_logs = new_data.get('logs', [])
-
-    # Filter to truly new logs
-    added = []
-    for log in new_logs:
-        if log['tableId'] not in existing_ids:
-            existing['logs'].append(log)
-            added.append(log['tableId'])
-            existing_ids.add(log['tableId'])
-
-    # Update metadata
-    existing['exportedAt'] = datetime.now().isoformat() + 'Z'
-    existing['totalLogs'] = len(existing['logs'])
+    hashes = record_hashes('logs', existing_path, existing['logs'])
+    added, updated, unchanged = merge_records(existing['logs'], new_data.get('logs', []), hashes)
 
-    # Save
-    with open(existing_path, 'w') as f:
-        json.dump(existing, f, indent=2)
+    digest = file_digest(existing_path)
+    if added or updated or created:
+        existing['exportedAt'] = datetime.now().isoformat() + 'Z'
+        existing['totalLogs'] = len(existing['logs'])
+        digest = save_json(existing_path, existing)
+    save_record_hashes('logs', digest, hashes)
 
-    print(f"Logs: Added {len(added)} new logs (total: {existing['totalLogs']})")
-    if added:
-        print(f"  New IDs: {', '.join(added)}")
-    return len(added)
+    report("Logs", added, updated, unchanged, len(existing['logs']))
+    return len(added) + len(updated)
 
 def clear_file(path: Path):
     """Reset a new_*.json file to empty state"""
@@ -133,7 +250,7 @@ def main():
     if total_added > 0:
         print(f"\nDone! Don't forget to commit and push to GitHub.")
     else:
-        print("\nNo new data to add.")
+        print("\nNo new or changed data to add.")
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Ask quick questions of detailed_games.json without editing app.js.
+
+Usage:
+  python scripts/query.py                          # per-player summary of all games
+  python scripts/query.py --player msiebert        # only games msiebert played
+  python scripts/query.py --map "Map 6" --since 2025-11-01
+  python scripts/query.py --games                  # list matching games instead
+"""
+
+import json
+import argparse
+from pathlib import Path
+
+from records import load_records, parse_result
+
+REPO_ROOT = Path(__file__).parent.parent
+DOCS_DATA_DIR = REPO_ROOT / "docs" / "data"
+
+DEFAULT_GAMES = DOCS_DATA_DIR / "detailed_games.json"
+
+def player_map(game: dict, player: str) -> str:
+    return game['stats'].get('Map', {}).get(player, '')
+
+
+def filter_games(games: list, player: str = None, map_name: str = None,
+                 since: str = None, until: str = None) -> list:
+    """Games matching every given filter.
+
+    map_name matches any player's map by substring (case-insensitive); when a
+    player is also given, only that player's map is checked. Dates are
+    inclusive YYYY-MM-DD strings; games without a date never match a date filter.
+    """
+    matched = []
+    for game in games:
+        if player and player not in game['players']:
+            continue
+        if map_name:
+            who = [player] if player else game['players']
+            if not any(map_name.lower() in player_map(game, p).lower() for p in who):
+                continue
+        date = game.get('date')
+        if since and (not date or date < since):
+            continue
+        if until and (not date or date > until):
+            continue
+        matched.append(game)
+    return matched
+
+
+def player_summary(games: list) -> dict:
+    """Games, wins, average score and average rank per player."""
+    totals = {}
+    for game in games:
+        results = game['stats'].get('Game result', {})
+        for player in game['players']:
+            parsed = parse_result(results.get(player))
+            if parsed is None:
+                continue
+            rank, score = parsed
+            t = totals.setdefault(player, {'games': 0, 'wins': 0, 'score': 0, 'rank': 0})
+            t['games'] += 1
+            t['wins'] += rank == 1
+            t['score'] += score
+            t['rank'] += rank
+
+    return {
+        player: {
+            'games': t['games'],
+            'wins': t['wins'],
+            'winRate': round(t['wins'] / t['games'], 3),
+            'avgScore': round(t['score'] / t['games'], 1),
+            'avgRank': round(t['rank'] / t['games'], 2),
+        }
+        for player, t in sorted(totals.items(), key=lambda item: -item[1]['games'])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the collected Ark Nova games')
+    parser.add_argument('--player', '-p', help='Only games this player played')
+    parser.add_argument('--map', '-m', dest='map_name', help='Only games on this map (substring)')
+    parser.add_argument('--since', help='Only games on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--until', help='Only games on or before this date (YYYY-MM-DD)')
+    parser.add_argument('--games', action='store_true', help='List matching games instead of a summary')
+    parser.add_argument('--data', default=str(DEFAULT_GAMES),
+                        help='Games file (default: docs/data/detailed_games.json)')
+    args = parser.parse_args()
+
+    games = filter_games(load_records(args.data), args.player, args.map_name, args.since, args.until)
+
+    if args.games:
+        for game in games:
+            results = game['stats'].get('Game result', {})
+            line = ', '.join(f"{p} {results.get(p, '')}" for p in game['players'])
+            print(f"{game['tableId']}  {game.get('date') or 'Unknown':10}  {line}")
+    else:
+        print(json.dumps(player_summary(games), indent=2))
+
+    print(f"\n{len(games)} matching game(s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Serve JSON answers about the collected games from a small local HTTP server.
+
+The games (as compact records, see records.py) and the card plays from the
+logs are loaded into memory once. Answers are kept in a bounded LRU
+cache keyed by the normalized query, so a dashboard asking the same thing
+again gets the cached body (or a 304 if it sends the ETag back). Whenever
+merge_data.py publishes new data files the server reloads them and drops the
+cache.
+
+Endpoints (all GET, all take player/map/since/until filters):
+  /summary                   per-player games, wins, average score and rank
+  /games                     matching games
+  /stats?stat=Appeal         min/avg/max of a numeric stat per player
+  /cards?min_plays=2         cards played per player in matching games
+  /sequences?length=3        common card sequences (from card_sequences.json)
+  /health                    loaded game/log counts and cache counters
+
+Usage:
+  python scripts/query_server.py                  # http://127.0.0.1:8765
+  python scripts/query_server.py --port 9000 --cache-size 512
+  curl 'http://127.0.0.1:8765/stats?stat=Appeal&map=Lagoon'
+"""
+
+import json
+import re
+import hashlib
+import argparse
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qsl
+
+import analyze_cards
+import sequences
+from query import filter_games, player_summary
+from records import load_records, parse_result
+
+REPO_ROOT = Path(__file__).parent.parent
+DOCS_DATA_DIR = REPO_ROOT / "docs" / "data"
+
+DEFAULT_GAMES = DOCS_DATA_DIR / "detailed_games.json"
+DEFAULT_LOGS = DOCS_DATA_DIR / "detailed_game_logs.json"
+DEFAULT_SEQUENCES = DOCS_DATA_DIR / "card_sequences.json"
+
+NUMBER_PATTERN = re.compile(r'^-?\d+(\.\d+)?$')
+ENDPOINTS = ('/summary', '/games', '/stats', '/cards', '/sequences')
+
+
+def parse_stat(value: str):
+    """A stat cell as a number ('31' -> 31, '1st (118)' -> 118), or None."""
+    value = (value or '').strip()
+    if NUMBER_PATTERN.match(value):
+        return float(value) if '.' in value else int(value)
+    result = parse_result(value)
+    return result[1] if result else None
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class GameData:
+    """In-memory copy of the published data files, reloaded when they change."""
+
+    def __init__(self, games_path=DEFAULT_GAMES, logs_path=DEFAULT_LOGS,
+                 sequences_path=DEFAULT_SEQUENCES):
+        self.paths = [Path(games_path), Path(logs_path), Path(sequences_path)]
+        self.signature = None
+        self.lock = threading.Lock()
+        self.games = []         # GameRecord per game
+        self.card_plays = {}    # table_id -> {player: [cards]}
+        self.sequence_index = sequences.SequenceIndex()
+
+    def current_signature(self) -> tuple:
+        sig = []
+        for path in self.paths:
+            try:
+                st = path.stat()
+                sig.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                sig.append(None)
+        return tuple(sig)
+
+    def refresh(self) -> bool:
+        """Reload if any data file changed since the last load. Returns True if it did."""
+        signature = self.current_signature()
+        if signature == self.signature:
+            return False
+        with self.lock:
+            if signature == self.signature:
+                return False
+            self._load()
+            self.signature = signature
+        return True
+
+    def _load(self):
+        # Build everything first and swap it in at the end, so requests
+        # running on other threads never see half-loaded data
+        games_path, logs_path, sequences_path = self.paths
+        games = load_records(games_path)
+
+        card_plays = {}
+        if logs_path.exists():
+            with open(logs_path, 'r') as f:
+                _, game_cards = analyze_cards.extract_card_plays(json.load(f)['logs'])
+            card_plays = {t: dict(players) for t, players in game_cards.items()}
+
+        sequence_index = sequences.load_index(sequences_path)
+
+        self.games = games
+        self.card_plays, self.sequence_index = card_plays, sequence_index
+        print(f"Loaded {len(games)} games, {len(card_plays)} logs")
+
+
+def normalize_query(path: str, query: str) -> tuple:
+    """Cache key: path plus sorted, trimmed, non-empty params (names lowercased)."""
+    params = {}
+    for key, value in parse_qsl(query):
+        key, value = key.strip().lower(), value.strip()
+        if value:
+            params[key] = value
+    return (path.rstrip('/') or '/', tuple(sorted(params.items())))
+
+
+def run_query(data: GameData, path: str, params: dict):
+    """Answer one query for a known endpoint.
+
+    Raises KeyError for a missing required parameter and ValueError for a
+    malformed one.
+    """
+    player = params.get('player')
+    games = filter_games(data.games, player, params.get('map'),
+                         params.get('since'), params.get('until'))
+
+    if path == '/summary':
+        return {'games': len(games), 'players': player_summary(games)}
+
+    if path == '/games':
+        return [
+            {
+                'tableId': g['tableId'],
+                'date': g.get('date'),
+                'players': g['players'],
+                'result': g['stats'].get('Game result', {}),
+                'map': g['stats'].get('Map', {}),
+            }
+            for g in games
+        ]
+
+    if path == '/stats':
+        stat = params['stat']
+        per_player = {}
+        for game in games:
+            # Whole numbers come straight from the record; only text cells
+            # like '1st (118)' need parsing
+            numbers = game.numbers(stat)
+            for p, value in game.cells(stat):
+                if player and p != player:
+                    continue
+                value = numbers[p] if p in numbers else parse_stat(value)
+                if value is not None:
+                    per_player.setdefault(p, []).append(value)
+        return {
+            'stat': stat,
+            'players': {
+                p: {'games': len(v), 'min': min(v), 'avg': round(sum(v) / len(v), 2), 'max': max(v)}
+                for p, v in sorted(per_player.items())
+            },
+        }
+
+    if path == '/cards':
+        min_plays = int(params.get('min_plays', 1))
+        counts = {}
+        for game in games:
+            for p, cards in data.card_plays.get(game['tableId'], {}).items():
+                if player and p != player:
+                    continue
+                for card in cards:
+                    player_counts = counts.setdefault(p, {})
+                    player_counts[card] = player_counts.get(card, 0) + 1
+        return {
+            p: sorted(([c, n] for c, n in cards.items() if n >= min_plays), key=lambda x: (-x[1], x[0]))
+            for p, cards in sorted(counts.items())
+        }
+
+    if path == '/sequences':
+        length = int(params['length']) if 'length' in params else None
+        return data.sequence_index.top_sequences(
+            length, player, int(params.get('min_games', 2)),
+            params.get('by', 'games'), int(params.get('limit', 20)),
+        )
+
+    raise ValueError(f"Unknown endpoint {path}")
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    data = None   # GameData, set by serve()
+    cache = None  # LRUCache, set by serve()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+
+        if self.data.refresh():
+            self.cache.clear()
+
+        if url.path == '/health':
+            self.send_json(200, {
+                'games': len(self.data.games),
+                'logs': len(self.data.card_plays),
+                'cache': {'entries': len(self.cache.entries), 'hits': self.cache.hits,
+                          'misses': self.cache.misses},
+            })
+            return
+
+        key = normalize_query(url.path, url.query)
+        # Including the data signature means a result computed from data
+        # that was replaced mid-request can never be served for the new data
+        cache_key = (self.data.signature,) + key
+        if key[0] not in ENDPOINTS:
+            self.send_json(404, {'error': f"Unknown endpoint {key[0]}",
+                                 'endpoints': list(ENDPOINTS) + ['/health']})
+            return
+
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            try:
+                result = run_query(self.data, key[0], dict(key[1]))
+            except KeyError as e:
+                self.send_json(400, {'error': f"Missing parameter: {e.args[0]}"})
+                return
+            except ValueError as e:
+                self.send_json(400, {'error': str(e)})
+                return
+            body = json.dumps(result).encode()
+            cached = ('"' + hashlib.sha1(body).hexdigest() + '"', body)
+            self.cache.put(cache_key, cached)
+
+        etag, body = cached
+        if etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_body(200, body, etag)
+
+    def send_json(self, status: int, payload):
+        self.send_body(status, json.dumps(payload).encode())
+
+    def send_body(self, status: int, body: bytes, etag: str = None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # keep the console for load messages
+
+
+def serve(host: str = '127.0.0.1', port: int = 8765, cache_size: int = 256, **paths):
+    QueryHandler.data = GameData(**paths)
+    QueryHandler.data.refresh()
+    QueryHandler.cache = LRUCache(cache_size)
+
+    server = ThreadingHTTPServer((host, port), QueryHandler)
+    print(f"Serving on http://{host}:{port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve queries over the collected games')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port (default: 8765)')
+    parser.add_argument('--cache-size', type=int, default=256,
+                        help='Max cached query results (default: 256)')
+    parser.add_argument('--games', default=str(DEFAULT_GAMES), help='Games file')
+    parser.add_argument('--logs', default=str(DEFAULT_LOGS), help='Game logs file')
+    args = parser.parse_args()
+
+    serve(args.host, args.port, args.cache_size, games_path=args.games, logs_path=args.logs)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory form of detailed_games.json for the long-running tools.
+
+A game loaded with json.load is ~75 dicts and a few hundred separate strings,
+almost all of them repeats ("msiebert", "Appeal", "Map 2: Riverside", "31").
+GameRecord keeps the same information with:
+
+  - player names, stat names, map names and other text cells stored once, so
+    every game shares one copy of each;
+  - the player list and the stat name list stored as shared tuples (most games
+    have the same 74 stats in the same order);
+  - every stat cell packed into one array('i') per game: whole numbers as
+    themselves, text cells ("1st (118)", "12h03", "-") as an index into one
+    table of strings shared by the records of one load, flagged in a per-game
+    bitmask.
+
+Records still read like the original dicts (record['stats']['Map'][player],
+record.get('date')), so query.py and sequences.py work on either, and
+to_dict() rebuilds the exact original game for export. A stat whose cells
+don't line up with the player list (a null value, a key for someone not in
+'players', a different key order) is rare, and is kept verbatim in a small
+per-record overflow dict instead of the array.
+
+Usage:
+  from records import load_records
+  games = load_records()                    # list of GameRecord
+  game.numbers('Appeal')                    # {player: 31, ...}
+  game.results()                            # (PlayerResult, ...)
+  game.to_dict()                            # original JSON shape
+
+  python scripts/records.py                 # load and report memory use
+"""
+
+import re
+import sys
+import json
+import argparse
+import tracemalloc
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+DOCS_DATA_DIR = REPO_ROOT / "docs" / "data"
+
+DEFAULT_GAMES = DOCS_DATA_DIR / "detailed_games.json"
+
+# "1st (118)" -> rank 1, score 118
+RESULT_PATTERN = re.compile(r'^(\d+)\w*\s*\((-?\d+)\)')
+
+CORE_FIELDS = ('tableId', 'url', 'players', 'date', 'stats')
+MISSING = None  # text cell with no value (the stat is in the overflow dict)
+
+
+class SharedValues:
+    """Tuples and text cells shared by the records of one load.
+
+    Each load_records() call gets its own, so a long-running process that
+    reloads the data frees the old table along with the old records.
+    """
+
+    __slots__ = ("tuples", "texts", "text_ids")
+
+    def __init__(self):
+        self.tuples = {}
+        self.texts = [MISSING]  # text cells are stored as indexes into this
+        self.text_ids = {MISSING: 0}
+
+    def share(self, values) -> tuple:
+        """Intern a tuple of strings, returning one shared copy per distinct tuple."""
+        values = tuple(sys.intern(v) for v in values)
+        return self.tuples.setdefault(values, values)
+
+    def text_id(self, value) -> int:
+        """Index of a text cell in the table, adding it if it's new."""
+        if value not in self.text_ids:
+            self.text_ids[value] = len(self.texts)
+            self.texts.append(value)
+        return self.text_ids[value]
+
+
+def load_games(games_path=DEFAULT_GAMES) -> list:
+    """Load the games list from detailed_games.json as plain dicts."""
+    with open(games_path, 'r') as f:
+        return json.load(f)['games']
+
+
+def parse_result(result: str):
+    """Return (rank, score) from a 'Game result' cell, or None if unranked."""
+    match = RESULT_PATTERN.match(result or '')
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def pack_cell(value):
+    """An int if the cell is a plain whole number that round-trips, else None."""
+    if isinstance(value, str) and value[-1:].isdigit():
+        try:
+            number = int(value)
+        except ValueError:
+            return None
+        if str(number) == value and -2**31 <= number < 2**31:
+            return number
+    return None
+
+
+class PlayerResult:
+    __slots__ = ("player", "rank", "score", "map")
+
+    def __init__(self, player: str, rank: int, score: int, map_name: str):
+        self.player = player
+        self.rank = rank
+        self.score = score
+        self.map = map_name
+
+    def __repr__(self):
+        return f"PlayerResult({self.player!r}, rank={self.rank}, score={self.score}, map={self.map!r})"
+
+
+class StatsView(Mapping):
+    """Read-only {stat: {player: value}} view of a record, built per lookup."""
+
+    __slots__ = ("record",)
+
+    def __init__(self, record: "GameRecord"):
+        self.record = record
+
+    def __getitem__(self, stat: str) -> dict:
+        if stat not in self.record.stat_names:
+            raise KeyError(stat)
+        return dict(self.record.cells(stat))
+
+    def __iter__(self):
+        return iter(self.record.stat_names)
+
+    def __len__(self):
+        return len(self.record.stat_names)
+
+    def __contains__(self, stat):
+        return stat in self.record.stat_names
+
+
+class GameRecord:
+    """One game, stored compactly; reads like the detailed_games.json dict."""
+
+    __slots__ = ("table_id", "url", "date", "players", "stat_names",
+                 "values", "text_mask", "fields", "extra", "overflow", "shared")
+
+    @classmethod
+    def from_dict(cls, game: dict, shared: SharedValues = None) -> "GameRecord":
+        record = cls()
+        record.shared = shared = shared or SharedValues()
+        record.table_id = game['tableId']
+        record.url = game.get('url')
+        record.date = game.get('date')
+        record.players = shared.share(game['players'])
+        record.fields = shared.share(game)  # original key order, for to_dict()
+        extra = {k: v for k, v in game.items() if k not in CORE_FIELDS}
+        record.extra = extra or None
+
+        stats = game.get('stats', {})
+        record.stat_names = shared.share(stats)
+        values = array('i', [0]) * (len(stats) * len(record.players))
+        text_mask = 0
+        overflow = {}
+        cell = 0
+        for stat in record.stat_names:
+            per_player = stats[stat]
+            if tuple(per_player) != record.players or MISSING in per_player.values():
+                overflow[stat] = per_player
+                per_player = {}
+            for player in record.players:
+                value = per_player.get(player, MISSING)
+                number = pack_cell(value)
+                if number is None:
+                    values[cell] = shared.text_id(value)
+                    text_mask |= 1 << cell
+                else:
+                    values[cell] = number
+                cell += 1
+        record.values = values
+        record.text_mask = text_mask
+        record.overflow = overflow or None
+        return record
+
+    def _offset(self, stat: str):
+        try:
+            return self.stat_names.index(stat) * len(self.players)
+        except ValueError:
+            return None
+
+    def cells(self, stat: str):
+        """Yield (player, value) for one stat; numbers come back as their original text."""
+        if self.overflow and stat in self.overflow:
+            yield from self.overflow[stat].items()
+            return
+        start = self._offset(stat)
+        if start is None:
+            return
+        for cell, player in enumerate(self.players, start):
+            if self.text_mask >> cell & 1:
+                yield player, self.shared.texts[self.values[cell]]
+            else:
+                yield player, str(self.values[cell])
+
+    def numbers(self, stat: str) -> dict:
+        """{player: int} for the stat's whole-number cells, without reparsing text."""
+        if self.overflow and stat in self.overflow:
+            numbers = {p: pack_cell(v) for p, v in self.overflow[stat].items()}
+            return {p: n for p, n in numbers.items() if n is not None}
+        start = self._offset(stat)
+        if start is None:
+            return {}
+        return {
+            player: self.values[cell]
+            for cell, player in enumerate(self.players, start)
+            if not self.text_mask >> cell & 1
+        }
+
+    def results(self) -> tuple:
+        """PlayerResult for every player with a ranked 'Game result'."""
+        maps = dict(self.cells('Map'))
+        rows = []
+        for player, result in self.cells('Game result'):
+            parsed = parse_result(result)
+            if parsed:
+                rows.append(PlayerResult(player, parsed[0], parsed[1], maps.get(player, '')))
+        return tuple(rows)
+
+    @property
+    def stats(self) -> StatsView:
+        return StatsView(self)
+
+    def __getitem__(self, key: str):
+        if key == 'tableId':
+            return self.table_id
+        if key == 'players':
+            return self.players
+        if key == 'stats':
+            return StatsView(self)
+        if key in self.fields:
+            if key in ('url', 'date'):
+                return getattr(self, key)
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict:
+        """The game exactly as it was in detailed_games.json."""
+        game = {}
+        for key in self.fields:
+            if key == 'players':
+                game[key] = list(self.players)
+            elif key == 'stats':
+                game[key] = {stat: dict(self.cells(stat)) for stat in self.stat_names}
+            else:
+                game[key] = self[key]
+        return game
+
+    def __repr__(self):
+        return f"GameRecord({self.table_id!r}, {list(self.players)!r})"
+
+
+def load_records(games_path=DEFAULT_GAMES) -> list:
+    """Load detailed_games.json as a list of GameRecord sharing one SharedValues."""
+    shared = SharedValues()
+
+    def convert(obj: dict):
+        # Called by json for every object, innermost first: turning each game
+        # into a record as soon as it is parsed means the whole file never
+        # exists as dicts at once
+        if 'tableId' in obj and 'stats' in obj:
+            return GameRecord.from_dict(obj, shared)
+        return obj
+
+    with open(games_path, 'r') as f:
+        return json.load(f, object_hook=convert)['games']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load games as compact records and report memory use')
+    parser.add_argument('--games', default=str(DEFAULT_GAMES), help='Games file')
+    parser.add_argument('--compare', action='store_true',
+                        help='Also measure loading the same file as plain dicts')
+    args = parser.parse_args()
+
+    loaders = [('records', load_records)]
+    if args.compare:
+        loaders.append(('dicts', load_games))
+
+    for name, loader in loaders:
+        tracemalloc.start()
+        games = loader(args.games)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:8} {len(games)} games: {current / 2**20:8.1f} MiB held, "
+              f"{peak / 2**20:8.1f} MiB peak")
+        del games
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Find which runs of cards players tend to play in order, and how often they win.
+
+Every player's card plays in a game (as extracted by analyze_cards.py) are
+added to a prefix trie: each node is a sequence of 2-4 consecutive plays and
+counts how many player-games contained it and how many of those were wins.
+Queries read the trie (and per-sequence totals kept alongside it) instead of
+rescanning the logs. The index is saved to
+docs/data/card_sequences.json and later runs only add games it hasn't seen.
+
+Only games that have both a log and a ranked result in detailed_games.json
+are indexed; a log whose result isn't in yet is picked up on a later run.
+Each indexed table keeps the content hash of its log and game (see
+merge_data.record_hash); if one of them has changed since, for example a
+re-scraped game with a corrected result, the index is rebuilt.
+
+Usage:
+  python scripts/sequences.py                        # update index, show most common
+  python scripts/sequences.py --by win-rate --min-games 3
+  python scripts/sequences.py --length 3 --player msiebert
+  python scripts/sequences.py --after "Sloth Bear"   # what tends to come next
+  python scripts/sequences.py --rebuild              # re-index every game
+"""
+
+import json
+import time
+import hashlib
+import argparse
+from pathlib import Path
+
+import analyze_cards
+from merge_data import record_hashes, save_json
+from records import load_games, parse_result
+
+REPO_ROOT = Path(__file__).parent.parent
+DOCS_DATA_DIR = REPO_ROOT / "docs" / "data"
+
+DEFAULT_LOGS = DOCS_DATA_DIR / "detailed_game_logs.json"
+DEFAULT_GAMES = DOCS_DATA_DIR / "detailed_games.json"
+DEFAULT_INDEX = DOCS_DATA_DIR / "card_sequences.json"
+
+MIN_LENGTH = 2
+MAX_LENGTH = 4
+
+
+class TrieNode:
+    __slots__ = ("games", "wins", "children")
+
+    def __init__(self):
+        self.games = 0     # player-games containing this sequence
+        self.wins = 0      # ... that the player won
+        self.children = {}
+
+
+class SequenceIndex:
+    """Counted n-gram trie of card plays, keyed by player so it can be filtered."""
+
+    def __init__(self, max_length: int = MAX_LENGTH):
+        self.max_length = max_length
+        self.roots = {}      # player -> TrieNode
+        self.tables = {}     # table ID -> content hash when it was indexed
+        self.totals = {}     # sequence -> [games, wins] summed over players
+        self._ranked = {}    # (length, player, by) -> sorted rows, reset when games are added
+
+    def add_sequence(self, player: str, cards: list, won: bool):
+        """Count every run of up to max_length consecutive cards, once per player-game."""
+        root = self.roots.setdefault(player, TrieNode())
+        seen = set()
+        for start in range(len(cards)):
+            node = root
+            seq = ()
+            for card in cards[start:start + self.max_length]:
+                node = node.children.setdefault(card, TrieNode())
+                seq += (card,)
+                if id(node) not in seen:
+                    seen.add(id(node))
+                    node.games += 1
+                    node.wins += won
+                    total = self.totals.setdefault(seq, [0, 0])
+                    total[0] += 1
+                    total[1] += won
+
+    def add_game(self, table_id: str, plays: dict, ranks: dict, table_hash: str = None) -> bool:
+        """Index one game's plays ({player: [cards]}). Returns False if already indexed."""
+        if table_id in self.tables:
+            return False
+        for player, cards in plays.items():
+            if player in ranks:
+                self.add_sequence(player, cards, ranks[player] == 1)
+        self.tables[table_id] = table_hash
+        self._ranked.clear()
+        return True
+
+    def _player_rows(self, player: str):
+        """Yield (sequence, games, wins) for every node in one player's trie."""
+        stack = [((card,), child) for card, child in self.roots[player].children.items()]
+        while stack:
+            seq, node = stack.pop()
+            yield seq, node.games, node.wins
+            stack.extend((seq + (card,), child) for card, child in node.children.items())
+
+    def _sorted_rows(self, length: int, player: str, by: str) -> list:
+        """All sequences of one length, sorted for a query; cached until the next add."""
+        key = (length, player, by)
+        if key not in self._ranked:
+            if player:
+                rows = self._player_rows(player) if player in self.roots else []
+            else:
+                rows = ((seq, games, wins) for seq, (games, wins) in self.totals.items())
+            rows = [r for r in rows if len(r[0]) == length]
+            if by == "win-rate":
+                rows.sort(key=lambda r: (-r[2] / r[1], -r[1], r[0]))
+            else:
+                rows.sort(key=lambda r: (-r[1], -r[2] / r[1], r[0]))
+            self._ranked[key] = rows
+        return self._ranked[key]
+
+    def top_sequences(self, length: int = None, player: str = None, min_games: int = 2,
+                      by: str = "games", limit: int = 20) -> list:
+        """Most common (or highest win-rate) sequences of the given length (default 2-4)."""
+        lengths = [length] if length else range(MIN_LENGTH, self.max_length + 1)
+        rows = []
+        for n in lengths:
+            matched = 0
+            for seq, games, wins in self._sorted_rows(n, player, by):
+                if games >= min_games:
+                    rows.append({"cards": list(seq), "games": games, "wins": wins,
+                                 "winRate": round(wins / games, 3)})
+                    matched += 1
+                    if matched == limit:
+                        break
+        if by == "win-rate":
+            rows.sort(key=lambda r: (-r["winRate"], -r["games"], r["cards"]))
+        else:
+            rows.sort(key=lambda r: (-r["games"], -r["winRate"], r["cards"]))
+        return rows[:limit]
+
+    def next_cards(self, prefix: list, player: str = None, limit: int = 20) -> list:
+        """Cards most often played straight after the given sequence."""
+        followers = {}
+        if player:
+            roots = [self.roots[player]] if player in self.roots else []
+        else:
+            roots = list(self.roots.values())
+        for root in roots:
+            node = root
+            for card in prefix:
+                node = node.children.get(card)
+                if node is None:
+                    break
+            if node is None:
+                continue
+            for card, child in node.children.items():
+                f = followers.setdefault(card, [0, 0])
+                f[0] += child.games
+                f[1] += child.wins
+        rows = [
+            {"card": card, "games": games, "wins": wins, "winRate": round(wins / games, 3)}
+            for card, (games, wins) in followers.items()
+        ]
+        rows.sort(key=lambda r: (-r["games"], r["card"]))
+        return rows[:limit]
+
+    def to_json(self) -> dict:
+        sequences = {}
+        for player in sorted(self.roots):
+            sequences[player] = sorted([list(seq), games, wins]
+                                       for seq, games, wins in self._player_rows(player))
+        return {
+            "generatedAt": "",
+            "maxLength": self.max_length,
+            "tables": dict(sorted(self.tables.items())),
+            "sequences": sequences,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "SequenceIndex":
+        index = cls(data.get("maxLength", MAX_LENGTH))
+        tables = data.get("tables", {})
+        if isinstance(tables, list):
+            # Saved before tables had hashes: they all look changed, so the
+            # next update rebuilds the index once
+            tables = dict.fromkeys(tables)
+        index.tables = tables
+        for player, rows in data.get("sequences", {}).items():
+            root = index.roots.setdefault(player, TrieNode())
+            for seq, games, wins in rows:
+                node = root
+                for card in seq:
+                    node = node.children.setdefault(card, TrieNode())
+                node.games, node.wins = games, wins
+                total = index.totals.setdefault(tuple(seq), [0, 0])
+                total[0] += games
+                total[1] += wins
+        return index
+
+
+def game_ranks(games: list) -> dict:
+    """{table_id: {player: rank}} for games with ranked results."""
+    ranks = {}
+    for game in games:
+        results = game['stats'].get('Game result', {})
+        parsed = {p: parse_result(results.get(p)) for p in game['players']}
+        ranked = {p: r[0] for p, r in parsed.items() if r is not None}
+        if ranked:
+            ranks[game['tableId']] = ranked
+    return ranks
+
+
+def load_index(index_path=DEFAULT_INDEX) -> SequenceIndex:
+    index_path = Path(index_path)
+    if not index_path.exists():
+        return SequenceIndex()
+    with open(index_path, 'r') as f:
+        return SequenceIndex.from_json(json.load(f))
+
+
+def update_index(logs_path=DEFAULT_LOGS, games_path=DEFAULT_GAMES, index_path=DEFAULT_INDEX,
+                 rebuild: bool = False) -> SequenceIndex:
+    """Add not-yet-indexed games to the saved index (or rebuild it) and save it.
+
+    Counts can't be taken back out of the trie, so if a table that is already
+    indexed has a different log or game hash now (or is gone), the whole
+    index is rebuilt. The index file is only rewritten when something was
+    added, so read-only queries leave it (and its mtime) alone.
+    """
+    index_path = Path(index_path)
+    index = SequenceIndex() if rebuild else load_index(index_path)
+
+    with open(logs_path, 'r') as f:
+        logs = json.load(f)['logs']
+    games = load_games(games_path)
+    ranks = game_ranks(games)
+
+    log_hashes = record_hashes('logs', logs_path, logs)
+    game_hashes = record_hashes('games', games_path, games)
+    current = {
+        table_id: hashlib.sha256((log_hash + game_hashes[table_id]).encode()).hexdigest()
+        for table_id, log_hash in log_hashes.items() if table_id in ranks
+    }
+
+    changed = [t for t, h in index.tables.items() if current.get(t) != h]
+    if changed and not rebuild:
+        print(f"{len(changed)} indexed game(s) changed since they were indexed, rebuilding")
+        index, rebuild = SequenceIndex(), True
+
+    logs = [log for log in logs if log['tableId'] in current and log['tableId'] not in index.tables]
+
+    _, game_cards = analyze_cards.extract_card_plays(logs)
+    added = 0
+    for log in logs:
+        table_id = log['tableId']
+        added += index.add_game(table_id, game_cards.get(table_id, {}), ranks[table_id],
+                                current[table_id])
+
+    if added or rebuild or not index_path.exists():
+        save_json(index_path, index.to_json())
+
+    print(f"Indexed {added} new game(s) ({len(index.tables)} total) in {index_path}")
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mine card play sequences from game logs')
+    parser.add_argument('--length', '-n', type=int, choices=range(MIN_LENGTH, MAX_LENGTH + 1),
+                        help='Only sequences of this length (default: 2-4)')
+    parser.add_argument('--player', '-p', help='Only this player\'s plays')
+    parser.add_argument('--min-games', type=int, default=2,
+                        help='Ignore sequences seen in fewer player-games (default: 2)')
+    parser.add_argument('--by', choices=['games', 'win-rate'], default='games',
+                        help='Sort by how common a sequence is, or by win rate')
+    parser.add_argument('--after', nargs='+', metavar='CARD',
+                        help='Show which cards follow this sequence instead')
+    parser.add_argument('--top', type=int, default=20, help='Rows to show (default: 20)')
+    parser.add_argument('--rebuild', action='store_true', help='Re-index every game')
+    parser.add_argument('--logs', default=str(DEFAULT_LOGS), help='Game logs file')
+    parser.add_argument('--games', default=str(DEFAULT_GAMES), help='Games file (for results)')
+    parser.add_argument('--index', default=str(DEFAULT_INDEX), help='Index file')
+    args = parser.parse_args()
+
+    index = update_index(args.logs, args.games, args.index, rebuild=args.rebuild)
+
+    start = time.perf_counter()
+    if args.after:
+        rows = index.next_cards(args.after, args.player, args.top)
+    else:
+        rows = index.top_sequences(args.length, args.player, args.min_games, args.by, args.top)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print()
+    for row in rows:
+        label = row['card'] if args.after else ' -> '.join(row['cards'])
+        print(f"{row['games']:4} games  {row['winRate']:6.1%} won  {label}")
+    print(f"\n{len(rows)} row(s) in {elapsed_ms:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()